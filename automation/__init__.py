@@ -1 +1,20 @@
 # This file makes Python treat the directory as a package
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+# Shared executor for blocking stdin/file work offloaded via run_in_executor.
+# A single warm pool avoids the loop's default executor spinning up a cold
+# thread on first use, and caps how many blocking calls run at once.
+IO_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="io")
+
+# Playwright traffic is a stream of small CDP messages over a websocket —
+# exactly the workload where uvloop's libuv-based loop beats the stock
+# selector loop. Installing the policy here covers every entry point that
+# imports the package before calling asyncio.run(). Optional on purpose:
+# uvloop ships no Windows wheels.
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
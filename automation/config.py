@@ -0,0 +1,35 @@
+"""Process-wide configuration snapshot for the entry-point scripts."""
+import os
+from dataclasses import dataclass
+
+from automation.env import load_env_once
+
+
+@dataclass(frozen=True)
+class Config:
+    """Env-derived settings bound once at startup.
+
+    Every os.getenv goes through the _Environ proxy; snapshotting the values
+    here keeps repeated reads (and any future polling loop) off that path and
+    gives one place to see everything the scripts consume.
+    """
+    email: str = ""
+    password: str = ""
+    max_applications: int = 5
+    headless: bool = False
+    keep_browser_open: bool = False
+
+    @classmethod
+    def load(cls) -> "Config":
+        load_env_once()
+        try:
+            max_applications = int(os.getenv("MAX_APPLICATIONS", "5"))
+        except ValueError:
+            max_applications = 5
+        return cls(
+            email=os.getenv("WORK_AT_A_STARTUP_EMAIL", ""),
+            password=os.getenv("WORK_AT_A_STARTUP_PASSWORD", ""),
+            max_applications=max_applications,
+            headless=os.getenv("HEADLESS", "false").lower() == "true",
+            keep_browser_open=os.getenv("KEEP_BROWSER_OPEN", "false").lower() == "true",
+        )
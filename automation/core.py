@@ -1,30 +1,259 @@
 import asyncio
+import io
+import json
 import logging
+import re
+import time
 from typing import Optional, Dict, Any, List
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
 import os
 
+import aiofiles
+import orjson
 from playwright.async_api import async_playwright, Page, Browser, BrowserContext
 
 from models.models import JobListing, Application, JobFilter, ApplicationStatus
 
 logger = logging.getLogger(__name__)
 
+def _utc_now_iso() -> str:
+    """Aware UTC timestamp with deterministic length (no microseconds).
+
+    datetime.utcnow() is deprecated in 3.12, and second precision is plenty
+    for run/application bookkeeping.
+    """
+    return datetime.now(timezone.utc).isoformat(timespec='seconds')
+
+# Login-form selector unions. CSS selector lists are evaluated by the browser
+# in a single matching pass, so one wait on the union replaces a serial probe
+# (and its per-selector timeout) for every candidate. The form-scoped entries
+# cover what the old form-scan fallback loop used to find, so a single wait
+# handles both the direct-input and inside-form cases.
+EMAIL_INPUT_SELECTORS = [
+    'form#sign-in-card input[type="email"]', 'form input[autocomplete="username"]',
+    'input#ycid-input', 'input[name="username"]', 'input[type="email"]',
+    'input[autocomplete="username"]', 'input[autocomplete="email"]',
+    'input[type="text"]', 'input.MuiInput-input'
+]
+EMAIL_SELECTOR_UNION = ", ".join(EMAIL_INPUT_SELECTORS)
+
+PASSWORD_INPUT_SELECTORS = [
+    'input[type="password"]', 'input[autocomplete="current-password"]',
+    'input[name="password"]', 'input#password'
+]
+PASSWORD_SELECTOR_UNION = ", ".join(PASSWORD_INPUT_SELECTORS)
+
+# Job-card container selectors, joined once so waits and in-page counts reuse
+# the same union.
+JOB_CARD_SELECTORS = ('.job-card', '[data-testid="job-card"]', '.job-listing', '.job-item')
+JOB_CARD_UNION = ", ".join(JOB_CARD_SELECTORS)
+
+# Apply-button wording variants, compiled into one alternation so a single
+# locator pass over the page's buttons replaces one CDP round-trip per variant.
+APPLY_BUTTON_TEXTS = [
+    "Apply Now", "Apply", "Apply for this job", "Apply for position",
+    "Submit application", "Apply with Indeed", "Apply with LinkedIn",
+    "Quick apply", "Apply for this position", "Apply with resume"
+]
+APPLY_BUTTON_RE = re.compile("|".join(re.escape(text) for text in APPLY_BUTTON_TEXTS), re.IGNORECASE)
+
+# Explicit description containers, tried first as a single union query. When
+# none matches, the extractor falls back to a readability-style text-density
+# walk instead of probing dozens of guessed selectors.
+DESCRIPTION_SELECTOR_UNION = ", ".join([
+    '.job-description', '.job-description-content', '[data-testid="job-description"]',
+    'div[itemprop="description"]', 'div.job-details', 'div.jobDescription'
+])
+
+# Elements whose presence confirms a logged-in session
+LOGIN_VERIFIED_UNION = (
+    'a[href*="/dashboard"], a[href*="/jobs"], [data-testid="user-avatar"], '
+    'img[alt*="Profile"], .user-avatar'
+)
+
+# Strictly authenticated-only elements, for probing a restored session on the
+# /jobs page — the broader union above includes a[href*="/jobs"], which every
+# job card matches there whether or not the session is still valid.
+SESSION_PROBE_UNION = '[data-testid="user-avatar"], img[alt*="Profile"], .user-avatar'
+
+SUBMIT_BUTTON_UNION = 'button[type="submit"], button:has-text("Log in"), button:has-text("Sign in")'
+
+# Playwright evaluates a comma-joined selector list in one pass, so a single
+# wait on the union replaces a worst-case N x timeout serial probe.
+SEND_MESSAGE_SELECTORS = [
+    'button:has-text("Send Message")',
+    'button:has-text("Send message")',
+    'button[data-testid*="send-message"]',
+    'button[aria-label*="Send Message"]',
+    'button[title*="Send Message"]'
+]
+SEND_MESSAGE_UNION = ", ".join(SEND_MESSAGE_SELECTORS)
+
+VIEW_JOB_CSS_SELECTORS = [
+    'a:has-text("View Job")',  # Anchor tag with text "View Job"
+    'button:has-text("View Job")',  # Button with text "View Job"
+    'a.orange-button:has-text("View Job")',  # Example if it has a specific class
+    '[data-testid*="view-job-button"]',  # If it has a test ID
+]
+VIEW_JOB_CSS_UNION = ", ".join(VIEW_JOB_CSS_SELECTORS)
+
+# XPath can't join a CSS union; only probed when the union finds nothing
+VIEW_JOB_XPATH_SELECTORS = [
+    '//a[contains(translate(., "VIEWJOB", "viewjob"), "view job") and contains(@class, "button")]',
+    '//button[contains(translate(., "VIEWJOB", "viewjob"), "view job")]'
+]
+
+# Keyword needles for the cover-letter description scan, lowercased once here
+# so the per-line loop only lowercases each line a single time. Each set is
+# compiled into one alternation so a line is scanned once for all needles
+# instead of once per needle.
+REQ_INDICATORS = ('requirement', 'qualification', 'skill', 'experience', 'proficiency', 'knowledge of', 'familiar with')
+RESP_INDICATORS = ('responsibilit', 'dutie', 'you will', 'role will', 'key function')
+REQ_INDICATOR_RE = re.compile("|".join(re.escape(needle) for needle in REQ_INDICATORS))
+RESP_INDICATOR_RE = re.compile("|".join(re.escape(needle) for needle in RESP_INDICATORS))
+
+# Third-person phrasings rewritten to first person in responsibility lines,
+# in one substitution pass rather than one scan per phrasing
+RESP_PRONOUNS = ('you will', 'the candidate will', 'they will')
+RESP_PRONOUN_RE = re.compile(r"\b(?:" + "|".join(RESP_PRONOUNS) + r")\b", re.IGNORECASE)
+
+# In-page collector for every labelled button with its selector path. Kept as
+# a standalone function expression so both the standalone collector and the
+# batched job-page snapshot share the same logic.
+COLLECT_BUTTONS_JS = """() => {
+    // Memoize computed paths per element: buttons in the same list row share
+    // their ancestor chain, so siblings reuse the parent's path instead of
+    // re-walking it.
+    const pathCache = new WeakMap();
+    function getPath(element) {
+        if (!element || !element.tagName || element.nodeType !== Node.ELEMENT_NODE) return '';
+        const cached = pathCache.get(element);
+        if (cached !== undefined) return cached;
+
+        let selector = element.tagName.toLowerCase();
+        let path;
+        if (element.id) {
+            path = selector + '#' + element.id;
+        } else {
+            // Single forward pass over the parent's children; the
+            // previousElementSibling walk was O(n^2) per level.
+            let nth = 0;
+            for (let c = element.parentNode.firstElementChild; c; c = c.nextElementSibling) {
+                if (c.tagName === element.tagName) { nth++; if (c === element) break; }
+            }
+            if (nth > 1) selector += ':nth-of-type(' + nth + ')';
+            const parentPath = getPath(element.parentNode);
+            path = parentPath ? parentPath + ' > ' + selector : selector;
+        }
+        pathCache.set(element, path);
+        return path;
+    }
+    const buttons = [];
+    document.querySelectorAll('button, a[role="button"], input[type="button"], input[type="submit"]').forEach(btn => {
+        // textContent avoids the forced layout innerText triggers per button.
+        // Typical button labels are short; skip the regex scan for those and
+        // only collapse whitespace on long multi-line text.
+        const raw = btn.textContent || '';
+        const text = raw.length < 64 ? raw.trim() : raw.replace(/\s+/g, ' ').trim();
+        if (!text) return;  // skip the expensive path build for unlabelled buttons
+        buttons.push({
+            text: text, tag: btn.tagName,
+            id: btn.id || '', classes: btn.className || '', path: getPath(btn)
+        });
+    });
+    return buttons;
+}"""
+
+# Cover-letter template, built once; the letter is produced by a single
+# format_map pass over this string.
+COVER_LETTER_TEMPLATE = """Dear Hiring Manager,
+
+I'm excited to apply for the {job_title} position at {company_name}. With my background in {your_field}, I'm confident in my ability to contribute effectively to your team.
+
+### Why I'm a Great Fit
+I noticed that you're looking for someone with:
+{requirements_section}
+
+### How I Can Add Value
+{responsibilities_section}
+
+### Why {company_name}
+I'm particularly drawn to {specific_aspect_company} because {specific_reason}. I'm excited about the opportunity to {specific_contribution} and help {specific_impact}.
+
+I'd welcome the opportunity to discuss how my background and skills align with your needs. Thank you for your time and consideration.
+
+Best regards,
+{your_name}"""
+
+# Where the logged-in session (cookies/localStorage) is cached between runs
+AUTH_STATE_PATH = Path(".auth/yc.json")
+AUTH_STATE_MAX_AGE_SECONDS = 12 * 60 * 60
+
 class JobAutomator:
     """Core automation class for interacting with workatastartup.com"""
-    
+
     BASE_URL = "https://www.workatastartup.com"
-    
-    def __init__(self, headless: bool = False, slow_mo: int = 100):
+
+    # Resource types that are pure page weight for scraping purposes
+    BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+
+    # Third-party analytics/tracking scripts; they contribute nothing to the
+    # DOM we scrape but keep the network busy long after the content is ready.
+    BLOCKED_URL_FRAGMENTS = (
+        "google-analytics", "googletagmanager", "doubleclick",
+        "segment.", "hotjar", "intercom", "fullstory"
+    )
+
+    def __init__(self, headless: bool = True, slow_mo: int = 0, block_assets: bool = True,
+                 test_mode: bool = True, generate_cover_letters: bool = False,
+                 user_data_dir: Optional[str] = None,
+                 cdp_url: Optional[str] = None):
+        """
+        Args:
+            headless: Run the browser without a visible window. Headless is
+                the default — a visible window drags in GPU/compositor work —
+                so pass headless=False only when watching a session.
+            slow_mo: Delay (ms) injected after every Playwright action. This is
+                purely for human observability — it multiplies every click/fill
+                and kills throughput — so it only takes effect in debug mode.
+            block_assets: Abort image/font/media requests to cut page weight.
+            test_mode: Dry-run applications without submitting.
+            generate_cover_letters: Produce cover letters during a test-mode
+                dry run. The interactive scripts set this because they display
+                and save the letter; batch dry runs leave it off and skip the
+                biggest CPU chunk of the inner loop. Outside test mode letters
+                are always generated (the application needs one).
+            user_data_dir: Optional path to a persistent Chromium profile.
+                When set, cookies and localStorage live in the profile itself
+                (launch_persistent_context), so login survives restarts without
+                the storage_state snapshot.
+            cdp_url: Optional CDP endpoint (e.g. http://localhost:9222) of an
+                already-running Chromium. Attaching skips the browser launch —
+                the most expensive step in the pipeline — and lets several
+                automator instances share one browser, each in its own context.
+        """
         self.headless = headless
-        self.slow_mo = slow_mo  # Slow down interactions (ms)
+        self.slow_mo = slow_mo  # Slow down interactions (ms); debug-only
+        self.block_assets = block_assets  # Abort image/font/media requests
+        self.test_mode = test_mode
+        self.generate_cover_letters = generate_cover_letters
+        self.user_data_dir = user_data_dir
+        self.cdp_url = cdp_url
+        # Happy-path screenshots and JSON dumps cost 100-300ms each; only take
+        # them when explicitly debugging. Failure-path screenshots stay on.
+        self.debug = os.getenv("JOB_AUTOMATOR_DEBUG", "false").lower() == "true"
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
-        
+
         # State
         self.logged_in = False
+        self._restored_session = False
+        self._jobs_api_url: Optional[str] = None  # First job-list XHR seen
+        # Button inventories keyed by URL + child count; building selector
+        # paths is the expensive part, so reuse them across identical pages.
+        self._button_cache: Dict[str, List[Dict[str, Any]]] = {}
         
     async def __aenter__(self):
         await self.setup()
@@ -37,40 +266,115 @@ class JobAutomator:
         """Initialize the browser and context"""
         logger.info("Initializing browser...")
         self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.chromium.launch(
-            headless=self.headless,
-            slow_mo=self.slow_mo,
-            args=[
-                '--disable-blink-features=AutomationControlled',
-                '--no-sandbox',
-                '--disable-dev-shm-usage'
-            ]
-        )
-        
-        # Create a new browser context with storage state
-        self.context = await self.browser.new_context(
-            viewport={'width': 1366, 'height': 768},
-            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            locale='en-US',
-            permissions=['geolocation'],
-            record_video_dir='videos/' if os.getenv('RECORD_VIDEO', 'false').lower() == 'true' else None
-        )
+        launch_args = [
+            '--disable-blink-features=AutomationControlled',
+            '--no-sandbox',
+            '--disable-dev-shm-usage'
+        ]
+        context_options = {
+            'viewport': {'width': 1366, 'height': 768},
+            'user_agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'locale': 'en-US',
+            'permissions': ['geolocation'],
+        }
+        # Only pass record_video_dir when actually recording; video capture
+        # writes webm to disk continuously for the whole session.
+        if os.getenv('RECORD_VIDEO', 'false').lower() == 'true':
+            context_options['record_video_dir'] = 'videos/'
+
+        if self.user_data_dir:
+            # Persistent profile: the session lives in the profile directory,
+            # so there is nothing to restore from a storage_state snapshot —
+            # login() just probes whether the profile is still signed in.
+            self.context = await self.playwright.chromium.launch_persistent_context(
+                self.user_data_dir,
+                headless=self.headless,
+                slow_mo=self.slow_mo if self.debug else 0,
+                args=launch_args,
+                **context_options
+            )
+            self._restored_session = True
+        else:
+            if self.cdp_url:
+                # Attach to an already-running Chromium; contexts created below
+                # are isolated per instance, so N automators can share one
+                # browser process over one websocket.
+                self.browser = await self.playwright.chromium.connect_over_cdp(self.cdp_url)
+            else:
+                self.browser = await self.playwright.chromium.launch(
+                    headless=self.headless,
+                    slow_mo=self.slow_mo if self.debug else 0,
+                    args=launch_args
+                )
+
+            # Reuse a recent saved session so login() can short-circuit entirely
+            storage_state = None
+            if AUTH_STATE_PATH.exists():
+                age = time.time() - AUTH_STATE_PATH.stat().st_mtime
+                if age < AUTH_STATE_MAX_AGE_SECONDS:
+                    storage_state = str(AUTH_STATE_PATH)
+                    logger.info(f"Restoring saved session state from {AUTH_STATE_PATH}")
+            self._restored_session = storage_state is not None
+
+            # Create a new browser context with storage state
+            self.context = await self.browser.new_context(storage_state=storage_state, **context_options)
         
         # Grant permissions for notifications (to avoid popups)
         await self.context.grant_permissions(['notifications'])
+
+        # Cut page weight: job pages load fine without images/fonts/media,
+        # and skipping them saves megabytes and seconds per navigation.
+        if self.block_assets:
+            await self._block_heavy_assets(self.context)
+
+        # Pre-install the button collector on every page so diagnostic calls
+        # invoke an already-parsed function instead of shipping ~1KB of JS
+        # source across CDP (and re-parsing it in V8) per invocation.
+        await self.context.add_init_script(f"window.__collectButtons = {COLLECT_BUTTONS_JS};")
         
-        # Create a new page
-        self.page = await self.context.new_page()
+        # Create a new page (persistent contexts open with a blank one; reuse it)
+        self.page = self.context.pages[0] if self.context.pages else await self.context.new_page()
         
-        # Enable request/response logging
-        self.page.on("request", lambda request: logger.debug(f"Request: {request.method} {request.url}"))
-        self.page.on("response", lambda response: logger.debug(f"Response: {response.status} {response.url}"))
+        # Enable request/response logging only when debug logging is on — the
+        # handlers fire per subresource (hundreds per page), and %-formatting
+        # keeps the message from being built unless it is actually emitted.
+        if logger.isEnabledFor(logging.DEBUG):
+            self.page.on("request", lambda request: logger.debug("Request: %s %s", request.method, request.url))
+            self.page.on("response", lambda response: logger.debug("Response: %s %s", response.status, response.url))
         
         # Handle dialog boxes
         self.page.on("dialog", lambda dialog: asyncio.create_task(dialog.accept()))
+
+        # Remember the first job-list XHR so get_job_listings can hit the JSON
+        # endpoint directly instead of scraping the rendered DOM.
+        self.page.on("response", self._capture_jobs_api_url)
         
         logger.info("Browser initialized")
     
+    def _capture_jobs_api_url(self, response):
+        """Records the first JSON job-list endpoint the site calls."""
+        if self._jobs_api_url:
+            return
+        try:
+            url = response.url
+            content_type = response.headers.get("content-type", "")
+            if "workatastartup.com" in url and "/jobs" in url and "application/json" in content_type:
+                self._jobs_api_url = url
+                logger.debug("Captured job-list API endpoint: %s", url)
+        except Exception:
+            pass  # Best-effort capture; the DOM path still works without it
+
+    async def _block_heavy_assets(self, context: BrowserContext):
+        """Register a route handler that aborts image/font/media and tracker requests."""
+        async def _route(route, request):
+            if (request.resource_type in self.BLOCKED_RESOURCE_TYPES
+                    or any(fragment in request.url for fragment in self.BLOCKED_URL_FRAGMENTS)):
+                await route.abort()
+            else:
+                await route.continue_()
+
+        await context.route("**/*", _route)
+
     async def close(self):
         """Close the browser and clean up"""
         logger.info("Closing browser...")
@@ -86,22 +390,40 @@ class JobAutomator:
         """Login to workatastartup.com with enhanced debugging"""
         if self.logged_in:
             return True
-            
+
+        # Fast path: a restored session turns a 10-20s login into one navigation
+        if self._restored_session and await self._try_restored_session():
+            return True
+
         logger.info("Starting login process...")
-        
+
         try:
-            # Navigate to the login page directly
-            login_url = "https://account.ycombinator.com/?continue=https%3A%2F%2Fwww.workatastartup.com%2F"
-            logger.info(f"Navigating to login page: {login_url}")
-            await self.page.goto(login_url, wait_until="networkidle")
-            
+            # _navigate_to_login_page owns navigation; a second goto here would
+            # just load the same page twice.
             await self._navigate_to_login_page()
             await self._fill_login_form(email, password)
-            await self._submit_login_form()
-            
+
+            # Arm the navigation wait before clicking so a fast redirect can't
+            # land in the gap between submit and verification.
+            submitted = False
+            try:
+                async with self.page.expect_navigation(wait_until="domcontentloaded", timeout=15000):
+                    await self._submit_login_form()
+                    submitted = True
+            except Exception:
+                if not submitted:
+                    # The submit click itself failed; surface it through
+                    # login()'s error handling instead of demoting it to a
+                    # debug line and burning the verification timeout too.
+                    raise
+                # Some failures (inline validation errors) never navigate;
+                # verification below decides what actually happened.
+                logger.debug("No navigation observed after submitting login form")
+
             if await self._verify_login_success():
                 self.logged_in = True
                 logger.info("Login successful")
+                await self._save_storage_state()
                 return True
             else:
                 logger.error("Login verification failed")
@@ -115,88 +437,95 @@ class JobAutomator:
                 await self.page.screenshot(path="login_error.png")
             raise
 
+    async def _try_restored_session(self) -> bool:
+        """Checks whether the restored storage state still carries a valid login."""
+        try:
+            await self.page.goto(f"{self.BASE_URL}/jobs", wait_until="domcontentloaded")
+            try:
+                # Short wait rather than an instant query: the header is
+                # client-rendered, and probing right after domcontentloaded
+                # would misread a valid session as expired and force the full
+                # login flow (which then trips over the already-logged-in
+                # redirect).
+                await self.page.wait_for_selector(SESSION_PROBE_UNION, timeout=3000)
+            except Exception:
+                logger.info("Saved session no longer valid; falling back to full login")
+                return False
+            self.logged_in = True
+            logger.info("Reused saved session; skipping login flow")
+            return True
+        except Exception as e:
+            logger.debug("Restored-session check failed: %s", str(e))
+        return False
+
+    async def _save_storage_state(self):
+        """Persists the logged-in session so future runs can skip login."""
+        if self.user_data_dir:
+            return  # Persistent profiles keep their own session on disk
+        try:
+            AUTH_STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            await self.context.storage_state(path=str(AUTH_STATE_PATH))
+            logger.info(f"Saved session state to {AUTH_STATE_PATH}")
+        except Exception as e:
+            logger.warning(f"Failed to persist session state: {str(e)}")
+
     async def _navigate_to_login_page(self):
         """Navigates to the login page and waits for the form."""
         login_url = "https://account.ycombinator.com/?continue=https%3A%2F%2Fwww.workatastartup.com%2F"
         logger.info(f"Navigating to login page: {login_url}")
-        await self.page.goto(login_url, wait_until="networkidle")
-        await self.page.screenshot(path="debug_login_page.png")
-        logger.info("Took screenshot: debug_login_page.png")
+        # domcontentloaded + the explicit form wait below is the real readiness
+        # signal; networkidle just added dead time (and can stall on long-polling).
+        await self.page.goto(login_url, wait_until="domcontentloaded")
+        if self.debug:
+            await self.page.screenshot(path="debug_login_page.png")
+            logger.info("Took screenshot: debug_login_page.png")
         logger.info("Waiting for login form...")
         await self.page.wait_for_selector('form#sign-in-card', state="visible", timeout=10000)
         current_url = self.page.url
         if "account.ycombinator.com" not in current_url:
             logger.warning(f"Unexpected URL after navigation: {current_url}")
 
-    async def _find_login_element(self, selectors: List[str], element_name: str, form_element=None) -> Optional[Any]:
-        """Finds a login element using a list of selectors."""
-        element_field = None
-        for selector in selectors:
-            try:
-                if form_element:
-                    element_field = await form_element.query_selector(selector)
-                else:
-                    element_field = await self.page.wait_for_selector(selector, timeout=2000, state="visible")
+    async def _find_login_locator(self, selector_union: str, element_name: str, scope=None, timeout: int = 5000):
+        """Returns a visible locator for the union selector, or None.
 
-                if element_field and await element_field.is_editable():
-                    logger.info(f"Found {element_name} input with selector: {selector}")
-                    return element_field
-                element_field = None  # Reset if not editable
-            except Exception as e:
-                logger.debug(f"{element_name.capitalize()} input selector {selector} did not work: {str(e)}")
-        return None
+        Locators poll renderer-side, so one wait replaces the Python-side retry
+        fan of repeated wait_for_selector calls, and the returned locator
+        auto-waits for editability on fill().
+        """
+        locator = (scope or self.page).locator(selector_union).first
+        try:
+            await locator.wait_for(state="visible", timeout=timeout)
+            logger.info(f"Found {element_name} input matching union selector")
+            return locator
+        except Exception as e:
+            logger.debug("%s union selector did not match: %s", element_name.capitalize(), str(e))
+            return None
 
     async def _fill_login_form(self, email: str, password: str):
         """Fills the login form with email and password."""
-        email_input_selectors = [
-            'input#ycid-input', 'input[name="username"]', 'input[type="email"]',
-            'input[autocomplete="username"]', 'input[autocomplete="email"]',
-            'input[type="text"]', 'input.MuiInput-input'
-        ]
-        password_input_selectors = [
-            'input[type="password"]', 'input[autocomplete="current-password"]',
-            'input[name="password"]', 'input#password'
-        ]
-        form_selectors = [
-            'form#sign-in-card', 'form', 'form[action*="login"]',
-            'form[action*="signin"]',
-            '//form[.//input[contains(@name, "email") or contains(@type, "email") or contains(@id, "email")]]'
-        ]
-
-        email_field = await self._find_login_element(email_input_selectors, "email")
-        form = None
+        email_field = await self._find_login_locator(EMAIL_SELECTOR_UNION, "email", timeout=8000)
 
         if not email_field:
-            for form_selector in form_selectors:
-                try:
-                    form = await self.page.wait_for_selector(form_selector, timeout=2000, state="visible")
-                    if form:
-                        logger.info(f"Found form with selector: {form_selector}")
-                        email_field = await self._find_login_element(email_input_selectors, "email", form_element=form)
-                        if email_field:
-                            break
-                except Exception as e:
-                    logger.debug(f"Form selector {form_selector} did not work: {str(e)}")
-
-        if not email_field:
-            await self.page.screenshot(path="login_form_not_found.png")
-            logger.error("Could not find email input field on the login page")
+            # Overlap the failure diagnostics; each is its own CDP round-trip
+            _, page_title = await asyncio.gather(
+                self.page.screenshot(path="login_form_not_found.png"),
+                self.page.title()
+            )
+            logger.error(f"Could not find email input field on the login page (title: {page_title})")
             raise Exception("Email input not found")
 
-        await self.page.screenshot(path="debug_login_form.png")
+        if self.debug:
+            await self.page.screenshot(path="debug_login_form.png")
         logger.info(f"Filling in email: {email}")
         try:
-            await email_field.click()
+            # locator.fill auto-waits for editability, so no click/is_editable
             await email_field.fill(email)
         except Exception as e:
             logger.error(f"Failed to fill email: {str(e)}")
             await self.page.screenshot(path="email_fill_error.png")
             raise
 
-        password_field = await self._find_login_element(password_input_selectors, "password", form_element=form)
-        if not password_field and form : # If not found globally, try within the form if form was found
-             password_field = await self._find_login_element(password_input_selectors, "password", form_element=form)
-
+        password_field = await self._find_login_locator(PASSWORD_SELECTOR_UNION, "password")
         if not password_field:
             logger.error("Could not find password field")
             await self.page.screenshot(path="password_field_not_found.png")
@@ -204,33 +533,27 @@ class JobAutomator:
 
         logger.info("Filling in password...")
         try:
-            await password_field.click()
             await password_field.fill(password)
         except Exception as e:
             logger.error(f"Failed to fill password: {str(e)}")
             await self.page.screenshot(path="password_fill_error.png")
             raise
-        await self.page.screenshot(path="debug_filled_form.png")
+        if self.debug:
+            await self.page.screenshot(path="debug_filled_form.png")
 
     async def _submit_login_form(self):
         """Submits the login form."""
-        submit_button_selectors = 'button[type="submit"], button:has-text("Log in"), button:has-text("Sign in")'
-        submit_button = await self.page.wait_for_selector(submit_button_selectors, timeout=5000)
-        if submit_button:
-            await submit_button.click()
-        else:
-            await self.page.keyboard.press('Enter')
+        # Locator click holds no remote handle and auto-waits; on a miss it
+        # raises into login()'s error handling rather than blind-pressing Enter.
+        await self.page.locator(SUBMIT_BUTTON_UNION).first.click(timeout=5000)
 
     async def _verify_login_success(self) -> bool:
         """Verifies if the login was successful."""
         try:
-            await self.page.wait_for_selector(
-                'a[href*="/dashboard"], a[href*="/jobs"], [data-testid="user-avatar"], img[alt*="Profile"], .user-avatar',
-                timeout=15000
-            )
+            await self.page.wait_for_selector(LOGIN_VERIFIED_UNION, timeout=15000)
             return True
         except Exception as e:
-            logger.debug(f"Login verification element not found: {str(e)}")
+            logger.debug("Login verification element not found: %s", str(e))
             return False
 
     async def _check_for_login_error_messages(self):
@@ -250,10 +573,17 @@ class JobAutomator:
         logger.info("Applying filters...")
         
         try:
-            # Navigate to jobs page
-            await self.page.goto(f"{self.BASE_URL}/jobs")
-            await self.page.wait_for_load_state("networkidle")
-            
+            # Drop any jobs XHR captured before now — the restored-session
+            # probe loads /jobs and captures the *unfiltered* feed, and
+            # first-wins would pin get_job_listings to it, silently turning
+            # these filters into a no-op. The next capture is the filtered one.
+            self._jobs_api_url = None
+
+            # Navigate to jobs page; the filter clicks below auto-wait for their
+            # targets, and we gate on '.job-listing' at the end, so there is no
+            # need to wait for network idle here.
+            await self.page.goto(f"{self.BASE_URL}/jobs", wait_until="domcontentloaded")
+
             # Apply experience filter (0-1 years)
             await self.page.click('button:has-text("Experience Level")')
             await self.page.click(f'button:has-text("{job_filter.experience_level}")')
@@ -284,14 +614,22 @@ class JobAutomator:
             raise RuntimeError("Browser not initialized. Call setup() first.")
             
         logger.info(f"Extracting up to {max_listings} job listings...")
-        
+
+        # Fast path: hit the JSON feed the page itself uses and skip the
+        # rendered-DOM scrape entirely. Degrade gracefully if the API shape
+        # changes out from under us.
+        if self._jobs_api_url:
+            try:
+                return await self.get_job_listings_api(max_listings)
+            except Exception as e:
+                logger.warning(f"Job API fast path failed ({str(e)}); falling back to DOM extraction")
+
         try:
             # Wait for job listings to load
-            await self.page.wait_for_selector('.job-card, [data-testid="job-card"], .job-listing, .job-item', timeout=10000)
-            
-            await self._scroll_to_load_jobs(max_listings)
-            jobs = await self._extract_job_data_from_page()
-            
+            await self.page.wait_for_selector(JOB_CARD_UNION, timeout=10000)
+
+            jobs = await self._scroll_and_extract_jobs(max_listings)
+
             # Filter out invalid jobs and limit to max_listings
             valid_jobs = [
                 job for job in jobs
@@ -308,26 +646,75 @@ class JobAutomator:
                 await self.page.screenshot(path="job_listings_error.png")
             raise
 
-    async def _scroll_to_load_jobs(self, max_listings: int):
-        """Scrolls the page to load job listings dynamically."""
-        last_height = await self.page.evaluate('document.body.scrollHeight')
-        job_selector = '.job-card, [data-testid="job-card"], .job-listing, .job-item'
+    async def get_job_listings_api(self, max_listings: int = 10) -> List[Dict[str, Any]]:
+        """Fetch job listings from the captured JSON endpoint.
 
-        while len(await self.page.query_selector_all(job_selector)) < max_listings:
-            await self.page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-            await asyncio.sleep(1.5) # Wait for content to load
+        Uses the context's request client, so the logged-in cookies ride along.
+        Raises if no endpoint has been captured or the payload shape is not
+        recognized; callers fall back to the DOM extractor.
+        """
+        if not self._jobs_api_url:
+            raise RuntimeError("No job-list API endpoint captured yet")
+
+        response = await self.context.request.get(self._jobs_api_url)
+        data = await response.json()
+
+        raw_jobs = data if isinstance(data, list) else data.get("jobs") or data.get("results") or []
+        jobs = []
+        for raw in raw_jobs:
+            if not isinstance(raw, dict):
+                continue
+            company = raw.get("company")
+            if isinstance(company, dict):
+                company = company.get("name")
+            url = raw.get("url") or (f"{self.BASE_URL}/jobs/{raw['id']}" if raw.get("id") else "")
+            job = {
+                "id": str(raw.get("id", "")),
+                "title": raw.get("title") or raw.get("role") or "",
+                "company": company or "Unknown Company",
+                "location": raw.get("location") or "Remote",
+                "url": url,
+                "description": (raw.get("description") or "")[:200],
+            }
+            if job["id"] and job["title"] and job["url"]:
+                jobs.append(job)
+            if len(jobs) >= max_listings:
+                break
 
-            new_height = await self.page.evaluate('document.body.scrollHeight')
-            if new_height == last_height:
-                break # Reached end of page
-            last_height = new_height
+        if not jobs:
+            raise ValueError("Job API returned no recognizable jobs")
 
-            if len(await self.page.query_selector_all(job_selector)) >= max_listings:
-                break
+        logger.info(f"Found {len(jobs)} jobs via API")
+        return jobs
+
+    async def _scroll_and_extract_jobs(self, max_listings: int) -> List[Dict[str, Any]]:
+        """Scrolls to load listings and extracts them in one in-page evaluation.
+
+        Running the whole scroll/count/extract loop inside the browser avoids a
+        Python<->browser round-trip (and ElementHandle marshalling) per scroll
+        step — only the final job array crosses the protocol boundary.
+        """
+        return await self.page.evaluate("""async ({maxListings, cardUnion}) => {
+            // Resolve as soon as new cards render (or give up after timeout)
+            // instead of paying a fixed sleep per scroll step.
+            const waitForMoreCards = (prevCount, timeout) => new Promise(resolve => {
+                const check = () => document.querySelectorAll(cardUnion).length > prevCount;
+                if (check()) return resolve(true);
+                const observer = new MutationObserver(() => {
+                    if (check()) { observer.disconnect(); resolve(true); }
+                });
+                observer.observe(document.body, {childList: true, subtree: true});
+                setTimeout(() => { observer.disconnect(); resolve(false); }, timeout);
+            });
+
+            let cardCount = document.querySelectorAll(cardUnion).length;
+            while (cardCount < maxListings) {
+                window.scrollTo(0, document.body.scrollHeight);
+                const grew = await waitForMoreCards(cardCount, 1500);
+                if (!grew) break;  // Reached end of page
+                cardCount = document.querySelectorAll(cardUnion).length;
+            }
 
-    async def _extract_job_data_from_page(self) -> List[Dict[str, Any]]:
-        """Extracts job data from the current page content."""
-        return await self.page.evaluate("""() => {
             const jobSelectors = [
                 '.job-card', '[data-testid="job-card"]', '.job-listing', '.job-item',
                 'div[class*="job"], article[class*="job"]', 'div[data-cy*="job"], article[data-cy*="job"]',
@@ -346,6 +733,9 @@ class JobAutomator:
                 if (jobElements.length >= 30) break;
             }
 
+            // Compiled once per evaluation, not once per job in the map below
+            const JOB_ID_PATTERNS = [/\/jobs?\/(\d+)/, /\/jobs?\/[^/]+-(\d+)/];
+
             return jobElements.map(job => {
                 const titleEl = job.querySelector('[data-qa*="job-title"], [data-test*="job-title"], h2, h3, .job-title, .title');
                 const companyEl = job.querySelector('[data-qa*="company"], [data-test*="company"], .company, .company-name, .employer');
@@ -355,7 +745,7 @@ class JobAutomator:
 
                 let jobId = '';
                 if (url) {
-                    const match = url.match(/\/jobs?\/(\d+)/) || url.match(/\/jobs?\/[^/]+-(\d+)/);
+                    const match = JOB_ID_PATTERNS[0].exec(url) || JOB_ID_PATTERNS[1].exec(url);
                     if (match && match[1]) jobId = match[1];
                 }
                 if (!jobId) {
@@ -374,122 +764,220 @@ class JobAutomator:
                     description: description
                 };
             });
-        }""")
-    
-    async def process_job_application(self, job: Dict[str, Any]) -> Dict[str, Any]:
-        """Process a single job application (test mode - doesn't submit)"""
-        if not self.page or not self.logged_in:
+        }""", {
+            "maxListings": max_listings,
+            "cardUnion": JOB_CARD_UNION
+        })
+
+    async def process_jobs(self, jobs: List[Dict[str, Any]], max_concurrency: int = 5) -> List[Dict[str, Any]]:
+        """
+        Process multiple job applications concurrently.
+
+        Fans out over a pool of pages in the logged-in context (pages cost
+        ~20ms to open versus ~200ms+ for a fresh context, and inherit cookies
+        and the asset-blocking routes for free) with a semaphore bounding
+        concurrency, so per-job navigation latency overlaps instead of adding
+        up serially.
+
+        Args:
+            jobs: Job dictionaries as returned by get_job_listings().
+            max_concurrency: Maximum number of jobs processed at once.
+
+        Returns:
+            A list of application results, in the same order as `jobs`.
+        """
+        if not self.context or not self.logged_in:
             raise RuntimeError("Not logged in. Call login() first.")
-            
+
+        if not jobs:
+            return []
+
+        max_concurrency = max(1, min(max_concurrency, len(jobs)))
+        logger.info(f"Processing {len(jobs)} jobs with concurrency {max_concurrency}...")
+
+        worker_pages: List[Page] = []
+        page_pool: asyncio.Queue = asyncio.Queue()
+        for _ in range(max_concurrency):
+            page = await self.context.new_page()
+            worker_pages.append(page)
+            page_pool.put_nowait(page)
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _one(job: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                page = await page_pool.get()
+                try:
+                    return await self.process_job_application(job, page=page)
+                finally:
+                    page_pool.put_nowait(page)
+
+        try:
+            return list(await asyncio.gather(*(_one(job) for job in jobs)))
+        finally:
+            for page in worker_pages:
+                await page.close()
+
+    async def process_job_application(self, job: Dict[str, Any], page: Optional[Page] = None) -> Dict[str, Any]:
+        """Process a single job application (test mode - doesn't submit)
+
+        Args:
+            job: Job dictionary as returned by get_job_listings().
+            page: Page to drive; defaults to the automator's main page so
+                  existing callers are unaffected.
+        """
+        page = page or self.page
+        if not page or not self.logged_in:
+            raise RuntimeError("Not logged in. Call login() first.")
+
         logger.info(f"Processing job application: {job.get('title', 'Unknown')}")
-        
+
         try:
             # Navigate to job page
             logger.info(f"Navigating to job page: {job.get('url')}")
-            await self.page.goto(job['url'])
-            await self.page.wait_for_load_state("networkidle")
-            
-            await self.page.screenshot(path=f"job_page_{job.get('id', 'unknown')}.png")
-            
-            job_details = await self._extract_job_details()
+            await page.goto(job['url'], wait_until="domcontentloaded")
+            try:
+                # Gate on actual content rather than network idle; the extraction
+                # below falls back to document.body anyway if this never appears.
+                await page.wait_for_selector(
+                    '.job-description, .job-description-content, [data-testid="job-description"]',
+                    timeout=10000
+                )
+            except Exception:
+                logger.debug("Job description selector did not appear quickly; continuing")
+
+            if self.debug:
+                await page.screenshot(path=f"job_page_{job.get('id', 'unknown')}.png")
+
+            job_details = await self._extract_job_details(page)
             full_job_info = self._compile_full_job_info(job, job_details)
-            self._save_job_details_for_debugging(full_job_info)
-            
+            if self.debug:
+                await self._save_job_details_for_debugging(full_job_info)
+
             logger.info(f"Successfully extracted job details. Title: {job.get('title', 'Unknown')}")
-            
-            cover_letter = await self.generate_cover_letter(full_job_info)
-            self._save_cover_letter(cover_letter, job.get('id', 'unknown'))
-            self._log_generated_cover_letter(cover_letter)
-            
-            await self._find_and_log_apply_button()
-            
+
+            if self.test_mode and not (self.generate_cover_letters or self.debug):
+                # A dry run with no consumer for the letter; skip the biggest
+                # CPU chunk of the inner loop unless a caller or debug mode
+                # asked for it.
+                cover_letter = None
+            else:
+                cover_letter = await self.generate_cover_letter(full_job_info)
+                await self._save_cover_letter(cover_letter, job.get('id', 'unknown'))
+                self._log_generated_cover_letter(cover_letter)
+
+            await self._find_and_log_apply_button(page)
+
             logger.info("TEST MODE: Application not submitted (test mode)")
-            
+
             return self._create_application_result(full_job_info, cover_letter, status="test_mode", success=True, test_mode=True)
-            
+
         except Exception as e:
             logger.error(f"Failed to process job application: {str(e)}", exc_info=True)
-            if self.page:
-                await self.page.screenshot(path=f"error_{job.get('id', 'unknown')}.png")
-                
-                # Save the page HTML for debugging
-                try:
-                    html_content = await self.page.content()
-                    with open(f"error_page_{job.get('id', 'unknown')}.html", 'w', encoding='utf-8') as f:
-                        f.write(html_content)
-                except Exception as html_err:
-                    logger.error(f"Failed to save page HTML: {str(html_err)}")
+            if page:
+                if not self.test_mode or self.debug:
+                    await page.screenshot(path=f"error_{job.get('id', 'unknown')}.png")
+
+                # Full-page HTML dumps are opt-in and size-capped — a failing
+                # batch would otherwise burn hundreds of MB of disk I/O.
+                if os.getenv("DUMP_ERROR_HTML") == "1":
+                    try:
+                        html_content = (await page.content())[:512_000]
+                        async with aiofiles.open(f"error_page_{job.get('id', 'unknown')}.html", 'w', encoding='utf-8') as f:
+                            await f.write(html_content)
+                    except Exception as html_err:
+                        logger.error(f"Failed to save page HTML: {str(html_err)}")
             
             return {
                 **job,
-                status: "error",
-                success: False,
-                error: str(e),
-                job_id: job.get('id', 'unknown')
+                "status": "error",
+                "success": False,
+                "error": str(e),
+                "job_id": job.get('id', 'unknown')
             }
 
-    async def _extract_job_details(self) -> Dict[str, str]:
-        """Extracts full job description and HTML content from the job page."""
-        return await self.page.evaluate("""() => {
-            const descriptionSelectors = [
-                '.job-description', '.job-description-content', '[data-testid="job-description"]',
-                'div[class*="description"]', 'div[class*="Description"]', 'section[class*="description"]',
-                'div[itemprop="description"]', 'div.job-details', 'div.description', 'div.jobDescription',
-                'div.job-description-text', 'div.job-details-content', 'div.job-details-container',
-                'div.job-content', 'div.job-body', 'div.job-page', 'div.job-container', 'div.job-listing',
-                'div.job', 'article.job', 'section.job', 'div[role="main"]', 'main', 'article', 'section',
-                'div.container', 'div.main-content', 'div.content', 'div#content', 'div#main', 'div#job',
-                'div#job-details', 'div#job-description', 'div#job-content', 'div#job-body', 'div#job-page',
-                'div#job-container', 'div#job-listing', 'div#job-description-content', 'div#job-details-content',
-                'div#job-description-text', 'div#job-details-container', 'div#job-content-container',
-                'div#main-content', 'div#content-container', 'div#main-container', 'div#container',
-                'div#page', 'div#app', 'div#root', 'body', 'html'
-            ];
-            let mainContent = null;
-            for (const selector of descriptionSelectors) {
-                const elements = Array.from(document.querySelectorAll(selector));
-                elements.sort((a, b) => (b.offsetWidth * b.offsetHeight) - (a.offsetWidth * a.offsetHeight));
-                for (const el of elements) {
-                    if (el.innerText && el.innerText.trim().length > 100) {
-                        mainContent = el;
-                        break;
-                    }
+    async def _extract_job_details(self, page: Optional[Page] = None) -> Dict[str, str]:
+        """Extracts full job description and HTML content from the job page.
+
+        Tries the explicit description selectors in one union query, then falls
+        back to a readability-style scoring walk (text length penalized by link
+        density) — one tree traversal instead of dozens of guessed selectors.
+
+        The same evaluate also snapshots the page's button inventory, priming
+        the button cache so a later no-apply-button diagnostic costs no extra
+        round-trip; all per-job reads ride on one CDP call.
+        """
+        page = page or self.page
+        snapshot = await page.evaluate("""(selectorUnion) => {
+            const describe = () => {
+                const explicit = document.querySelector(selectorUnion);
+                if (explicit && explicit.innerText && explicit.innerText.trim().length > 100) {
+                    return {
+                        full_description: explicit.innerText.trim(),
+                        html_content: explicit.innerHTML,
+                        found_using: explicit.tagName.toLowerCase() + (explicit.id ? '#' + explicit.id : '') + (explicit.className ? '.' + explicit.className.replace(/\s+/g, '.') : '')
+                    };
+                }
+
+                // Readability-style heuristic: score container elements by text
+                // length, penalizing link-heavy (navigation/listing) blocks.
+                let best = null, bestScore = 0;
+                const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_ELEMENT);
+                for (let el = walker.nextNode(); el; el = walker.nextNode()) {
+                    if (!/^(DIV|SECTION|ARTICLE|MAIN)$/.test(el.tagName)) continue;
+                    const text = el.innerText;
+                    if (!text || text.length < 200) continue;
+                    const links = el.querySelectorAll('a').length;
+                    const score = text.length / (1 + links * 50);
+                    if (score > bestScore) { bestScore = score; best = el; }
+                }
+                if (best) {
+                    return {
+                        full_description: best.innerText.trim(),
+                        html_content: best.innerHTML,
+                        found_using: 'heuristic:text-density'
+                    };
                 }
-                if (mainContent) break;
-            }
-            if (mainContent) {
                 return {
-                    full_description: mainContent.innerText.trim(),
-                    html_content: mainContent.innerHTML,
-                    found_using: mainContent.tagName.toLowerCase() + (mainContent.id ? '#' + mainContent.id : '') + (mainContent.className ? '.' + mainContent.className.replace(/\s+/g, '.') : '')
+                    full_description: document.body.innerText,
+                    html_content: document.documentElement.outerHTML,
+                    found_using: 'fallback:document.body'
                 };
-            }
-            return {
-                full_description: document.body.innerText,
-                html_content: document.documentElement.outerHTML,
-                found_using: 'fallback:document.body'
             };
-        }""")
+
+            const details = describe();
+            details.cache_key = location.href + '#' + document.body.childElementCount;
+            details.buttons = window.__collectButtons();
+            return details;
+        }""", DESCRIPTION_SELECTOR_UNION)
+
+        self._button_cache[snapshot.pop("cache_key")] = snapshot.pop("buttons")
+        return snapshot
 
     def _compile_full_job_info(self, job: Dict[str, Any], job_details: Dict[str, str]) -> Dict[str, Any]:
         """Combines initial job info with extracted details."""
-        return {**job, **job_details, "scraped_at": datetime.utcnow().isoformat()}
+        return {**job, **job_details, "scraped_at": _utc_now_iso()}
 
-    def _save_job_details_for_debugging(self, full_job_info: Dict[str, Any]):
-        """Saves the full job information to a JSON file for debugging."""
+    async def _save_job_details_for_debugging(self, full_job_info: Dict[str, Any]):
+        """Saves the full job information to a JSON file for debugging.
+
+        Uses aiofiles so a slow disk write cannot stall the event loop (and
+        with it every other in-flight job in process_jobs).
+        """
         job_id = full_job_info.get('id', 'unknown')
         try:
-            with open(f"job_{job_id}.json", 'w', encoding='utf-8') as f:
-                import json
-                json.dump(full_job_info, f, ensure_ascii=False, indent=2)
+            # orjson serializes the multi-hundred-KB html_content payload far
+            # faster than stdlib json; it emits bytes, so write binary.
+            async with aiofiles.open(f"job_{job_id}.json", 'wb') as f:
+                await f.write(orjson.dumps(full_job_info, option=orjson.OPT_INDENT_2))
         except Exception as e:
             logger.error(f"Failed to save job details for {job_id}: {str(e)}")
 
-    def _save_cover_letter(self, cover_letter: str, job_id: str):
+    async def _save_cover_letter(self, cover_letter: str, job_id: str):
         """Saves the generated cover letter to a text file."""
         try:
-            with open(f"cover_letter_{job_id}.txt", 'w', encoding='utf-8') as f:
-                f.write(cover_letter)
+            async with aiofiles.open(f"cover_letter_{job_id}.txt", 'w', encoding='utf-8') as f:
+                await f.write(cover_letter)
         except Exception as e:
             logger.error(f"Failed to save cover letter for {job_id}: {str(e)}")
 
@@ -497,80 +985,70 @@ class JobAutomator:
         """Logs the generated cover letter."""
         logger.info("\n" + "="*80 + "\nGENERATED COVER LETTER:\n" + "-"*80 + f"\n{cover_letter}\n" + "="*80 + "\n")
 
-    async def _find_and_log_apply_button(self):
+    async def _find_and_log_apply_button(self, page: Optional[Page] = None):
         """Finds the apply button and logs its presence or alternatives."""
-        apply_button_texts = [
-            "Apply Now", "Apply", "Apply for this job", "Apply for position",
-            "Submit application", "Apply with Indeed", "Apply with LinkedIn",
-            "Quick apply", "Apply for this position", "Apply with resume"
-        ]
+        page = page or self.page
         apply_button = None
-        for btn_text in apply_button_texts:
-            try:
-                # Use a more specific selector if possible, e.g., button or a with role="button"
-                button_selector = f'button:has-text("{btn_text}"), a[role="button"]:has-text("{btn_text}")'
-                # Wait for a short period to see if the button appears
-                current_button = await self.page.wait_for_selector(button_selector, timeout=1000, state="visible")
-                if current_button: # Check if it's visible and enabled (or whatever criteria you need)
-                    logger.info(f"Found apply button with text: '{btn_text}'")
-                    apply_button = current_button
-                    break
-            except Exception: # TimeoutError if not found within timeout
-                logger.debug(f"Apply button with text '{btn_text}' not found or not visible/enabled quickly.")
-                continue # Try next button text
+        try:
+            # One locator pass scans every button against the compiled text
+            # alternation instead of waiting on each wording variant in turn.
+            locator = page.locator('button, a[role="button"]', has_text=APPLY_BUTTON_RE).first
+            apply_button = await locator.element_handle(timeout=2000)
+            if apply_button:
+                button_text = (await apply_button.inner_text()).strip()
+                logger.info(f"Found apply button with text: '{button_text}'")
+                # Release the remote handle; we only needed it for logging, and
+                # retained handles pin DOM nodes in the renderer heap.
+                await apply_button.dispose()
+        except Exception:  # TimeoutError if no variant matched within timeout
+            logger.debug("No apply button matched any known wording quickly.")
 
         if not apply_button:
             logger.warning("No primary apply button found. Logging page button structure for debugging.")
-            await self._log_page_button_structure()
+            await self._log_page_button_structure(page)
         else:
             logger.info("Apply button found (not clicking in test mode).")
 
-    async def _log_page_button_structure(self):
+    async def _log_page_button_structure(self, page: Optional[Page] = None):
         """Logs the structure of all buttons on the page for debugging."""
-        page_structure = await self.page.evaluate("""() => {
-            function getPath(element) {
-                if (!element || !element.tagName) return '';
-                const path = [];
-                while (element.nodeType === Node.ELEMENT_NODE) {
-                    let selector = element.tagName.toLowerCase();
-                    if (element.id) { selector += '#' + element.id; path.unshift(selector); break; }
-                    else {
-                        let sib = element, nth = 1;
-                        while (sib = sib.previousElementSibling) { if (sib.tagName.toLowerCase() === selector) nth++; }
-                        if (nth > 1) selector += ':nth-of-type(' + nth + ')';
-                    }
-                    path.unshift(selector);
-                    element = element.parentNode;
-                }
-                return path.join(' > ');
-            }
-            const buttons = [];
-            document.querySelectorAll('button, a[role="button"], input[type="button"], input[type="submit"]').forEach(btn => {
-                buttons.push({
-                    text: btn.innerText.replace(/\s+/g, ' ').trim(), tag: btn.tagName,
-                    id: btn.id || '', classes: btn.className || '', path: getPath(btn)
-                });
-            });
-            return buttons;
-        }""")
-        logger.info("Page buttons:")
-        for btn in page_structure:
-            if btn['text']:
-                logger.info(f"- {btn['text']} (tag: {btn['tag']}, id: {btn['id']}, classes: {btn['classes']}) Path: {btn['path']}")
+        page = page or self.page
+        cache_key = await page.evaluate("location.href + '#' + document.body.childElementCount")
+        page_structure = self._button_cache.get(cache_key)
+        if page_structure is not None:
+            logger.debug("Reusing cached button inventory for %s", cache_key)
+        else:
+            page_structure = await self._collect_page_buttons(page)
+            self._button_cache[cache_key] = page_structure
+        # One serialized blob instead of a formatted log line (and its handler
+        # lock) per button; the collector already filters out unlabelled ones.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Page buttons: %s", json.dumps(page_structure))
+
+    async def _collect_page_buttons(self, page: Page) -> List[Dict[str, Any]]:
+        """Collects every labelled button on the page with its selector path.
+
+        Calls the collector installed once per context by setup()'s init
+        script; every page these methods drive belongs to that context, so
+        the ~1.5KB collector source never rides along on the call.
+        """
+        return await page.evaluate("() => window.__collectButtons()")
 
     def _create_application_result(self, full_job_info: Dict[str, Any], cover_letter: str, status: str, success: bool, test_mode: bool = False, error: Optional[str] = None) -> Dict[str, Any]:
-        """Creates a structured result for the job application process."""
-        result = {
-            **full_job_info,
-            "status": status,
-            "success": success,
-            "cover_letter": cover_letter,
-            "applied_at": datetime.utcnow().isoformat() if success else None,
-            "test_mode": test_mode
-        }
+        """Creates a structured result for the job application process.
+
+        Annotates full_job_info in place — the caller hands over ownership, and
+        copying would duplicate the multi-KB full_description per job.
+        """
+        full_job_info.update(
+            status=status,
+            success=success,
+            cover_letter=cover_letter,
+            applied_at=_utc_now_iso() if success else None,
+            test_mode=test_mode
+        )
         if error:
-            result["error"] = error
-        return result
+            full_job_info["error"] = error
+        return full_job_info
     
     async def generate_cover_letter(self, job_info: Dict[str, Any]) -> str:
         """Generate a personalized cover letter for the job using job details"""
@@ -582,23 +1060,18 @@ class JobAutomator:
             
             requirements, responsibilities = self._extract_requirements_and_responsibilities(job_info)
 
-            cover_letter_template = self._get_cover_letter_template()
-
-            formatted_letter = cover_letter_template.format(
-                job_title=job_title,
-                company_name=company_name,
-                requirements_section=self._format_list_section(requirements, "Strong problem-solving skills and a passion for technology"),
-                responsibilities_section=self._format_list_section(responsibilities, "I'm eager to bring my skills to help achieve company goals.", transform_func=self._transform_responsibility_to_first_person),
-                your_field="software engineering",
-                relevant_skills="Python, web development, and problem-solving",
-                relevant_experience="building scalable applications",
-                specific_aspect_company=f'the innovative work {company_name} is doing',
-                specific_reason="I admire your commitment to excellence", # Generic, can be improved
-                specific_contribution="contribute to your team",
-                specific_impact="drive meaningful results",
-                your_name="[Your Name]" # Placeholder for actual name
-            )
-            return formatted_letter
+            return COVER_LETTER_TEMPLATE.format_map({
+                "job_title": job_title,
+                "company_name": company_name,
+                "requirements_section": self._format_list_section(requirements, "Strong problem-solving skills and a passion for technology"),
+                "responsibilities_section": self._format_list_section(responsibilities, "I'm eager to bring my skills to help achieve company goals.", transform_func=self._transform_responsibility_to_first_person),
+                "your_field": "software engineering",
+                "specific_aspect_company": f'the innovative work {company_name} is doing',
+                "specific_reason": "I admire your commitment to excellence",  # Generic, can be improved
+                "specific_contribution": "contribute to your team",
+                "specific_impact": "drive meaningful results",
+                "your_name": "[Your Name]"  # Placeholder for actual name
+            })
             
         except Exception as e:
             logger.error(f"Error generating cover letter: {str(e)}")
@@ -607,61 +1080,42 @@ class JobAutomator:
     def _extract_requirements_and_responsibilities(self, job_info: Dict[str, Any]) -> tuple[List[str], List[str]]:
         """Extracts key requirements and responsibilities from job description."""
         job_description = job_info.get('full_description', '')
-        lines = job_description.split('\n')
         requirements, responsibilities = [], []
 
-        req_indicators = ['requirement', 'qualification', 'skill', 'experience', 'proficiency', 'knowledge of', 'familiar with']
-        resp_indicators = ['responsibilit', 'dutie', 'you will', 'role will', 'key function']
-
-        for line in lines:
+        # Stream lines instead of materializing a full split() list; combined
+        # with the early break below, long descriptions are barely touched.
+        for line in io.StringIO(job_description):
             line = line.strip()
             if not line: continue
-            if any(indicator in line.lower() for indicator in req_indicators):
+            lowered = line.lower()  # lowercase once, not once per indicator
+            if len(requirements) < 5 and REQ_INDICATOR_RE.search(lowered):
                 requirements.append(line)
-            elif any(indicator in line.lower() for indicator in resp_indicators):
+            elif len(responsibilities) < 5 and RESP_INDICATOR_RE.search(lowered):
                 responsibilities.append(line)
+            if len(requirements) >= 5 and len(responsibilities) >= 5:
+                break  # no need to scan the rest of a long description
 
-        return requirements[:5], responsibilities[:5]
-
-    def _get_cover_letter_template(self) -> str:
-        """Returns the cover letter template string."""
-        return """Dear Hiring Manager,
-
-I'm excited to apply for the {job_title} position at {company_name}. With my background in {your_field}, I'm confident in my ability to contribute effectively to your team.
-
-### Why I'm a Great Fit
-I noticed that you're looking for someone with:
-{requirements_section}
-
-### How I Can Add Value
-{responsibilities_section}
-
-### Why {company_name}
-I'm particularly drawn to {specific_aspect_company} because {specific_reason}. I'm excited about the opportunity to {specific_contribution} and help {specific_impact}.
-
-I'd welcome the opportunity to discuss how my background and skills align with your needs. Thank you for your time and consideration.
-
-Best regards,
-{your_name}"""
+        return requirements, responsibilities
 
     def _format_list_section(self, items: List[str], default_text: str, transform_func: Optional[callable] = None) -> str:
         """Formats a list of items into a bulleted string section for the cover letter."""
         if not items:
             return f"- {default_text}\n"
 
-        section_str = ""
-        for item in items:
-            processed_item = transform_func(item) if transform_func else item
-            section_str += f"- {processed_item}\n"
-        return section_str
+        # One join allocation instead of a growing += string per item, and the
+        # transform_func check is hoisted out of the loop.
+        transform = transform_func or (lambda item: item)
+        return "".join(f"- {transform(item)}\n" for item in items)
 
     def _transform_responsibility_to_first_person(self, resp_text: str) -> str:
-        """Transforms a responsibility statement to the first person."""
-        resp_text_lower = resp_text.lower()
-        for pronoun in ['you will', 'the candidate will', 'they will']:
-            if pronoun in resp_text_lower:
-                resp_text_lower = resp_text_lower.replace(pronoun, 'I can')
-        return resp_text_lower.capitalize() if resp_text_lower else ""
+        """Transforms a responsibility statement to the first person.
+
+        The case-insensitive pattern makes the lower()/capitalize() passes
+        unnecessary — and they mangled acronyms like SQL or AWS anyway — so
+        only the first letter is touched.
+        """
+        transformed = RESP_PRONOUN_RE.sub('I can', resp_text)
+        return transformed[:1].upper() + transformed[1:] if transformed else ""
 
     def _get_fallback_cover_letter(self, job_info: Dict[str, Any]) -> str:
         """Returns a fallback cover letter template."""
@@ -685,7 +1139,7 @@ Best regards,
             A dictionary containing the results of the automation run.
         """
         results: Dict[str, Any] = {
-            "start_time": datetime.utcnow().isoformat(),
+            "start_time": _utc_now_iso(),
             "applications": [],
             "success_count": 0,
             "error_count": 0
@@ -707,19 +1161,16 @@ Best regards,
             # Get job listings
             jobs = await self.get_job_listings(max_listings=max_applications)
             
-            # Process each job
-            for job in jobs:
-                result = await self.process_job_application(job)
-                results["applications"].append(result)
-                
+            # Process jobs concurrently over the pooled worker contexts; wall
+            # time tracks the slowest job instead of the sum of all of them.
+            results["applications"] = await self.process_jobs(jobs, max_concurrency=3)
+
+            for result in results["applications"]:
                 if result.get("success"):
                     results["success_count"] += 1
                 else:
                     results["error_count"] += 1
-                
-                # Add a small delay between applications
-                await asyncio.sleep(5)
-            
+
             results["status"] = "completed"
             
         except Exception as e:
@@ -730,7 +1181,7 @@ Best regards,
         finally:
             # Clean up
             await self.close()
-            results["end_time"] = datetime.utcnow().isoformat()
+            results["end_time"] = _utc_now_iso()
             
         return results
 
@@ -744,29 +1195,20 @@ Best regards,
 
         logger.info("Attempting to click the 'Send message' button...")
         try:
-            # Common selectors for a "Send Message" button. These might need adjustment.
-            send_message_selectors = [
-                'button:has-text("Send Message")',
-                'button:has-text("Send message")',
-                'button[data-testid*="send-message"]',
-                'button[aria-label*="Send Message"]',
-                'button[title*="Send Message"]'
-            ]
-
+            # One wait on the selector union covers every variant at once
             send_button = None
-            for selector in send_message_selectors:
-                try:
-                    button = await self.page.wait_for_selector(selector, state="visible", timeout=5000)
-                    if button and await button.is_enabled():
-                        send_button = button
-                        logger.info(f"Found 'Send message' button with selector: {selector}")
-                        break
-                except Exception:
-                    logger.debug(f"'Send message' button not found with selector: {selector}")
+            try:
+                button = await self.page.wait_for_selector(SEND_MESSAGE_UNION, state="visible", timeout=5000)
+                if button and await button.is_enabled():
+                    send_button = button
+                    logger.info("Found 'Send message' button")
+            except Exception:
+                logger.debug("No 'Send message' button matched the selector union")
 
             if not send_button:
                 logger.warning("Could not find an enabled 'Send message' button on the page.")
-                await self.page.screenshot(path="send_message_button_not_found.png")
+                if self.debug:
+                    await self.page.screenshot(path="send_message_button_not_found.png")
                 # Optionally, log page structure here if needed for debugging
                 return False
 
@@ -778,7 +1220,7 @@ Best regards,
 
         except Exception as e:
             logger.error(f"Failed to click 'Send message' button: {str(e)}")
-            if self.page:
+            if self.page and self.debug:
                 await self.page.screenshot(path="send_message_button_error.png")
             return False
 
@@ -796,42 +1238,42 @@ Best regards,
 
         logger.info(f"Attempting to click 'View job' button at index {job_index}...")
         try:
-            # Selectors for "View job" buttons. These are common patterns.
-            # The key is to find a selector that uniquely identifies these buttons,
-            # possibly by text, color (though harder with CSS), or data attributes.
-            view_job_selectors = [
-                'a:has-text("View Job")',  # Anchor tag with text "View Job"
-                'button:has-text("View Job")', # Button with text "View Job"
-                'a.orange-button:has-text("View Job")', # Example if it has a specific class
-                '[data-testid*="view-job-button"]', # If it has a test ID
-                '//a[contains(translate(., "VIEWJOB", "viewjob"), "view job") and contains(@class, "button")]', # XPath for case-insensitive text and class
-                '//button[contains(translate(., "VIEWJOB", "viewjob"), "view job")]' # XPath for case-insensitive text
-            ]
-
+            # The CSS union finds every variant in one query; the XPath
+            # fallbacks only run when it comes back empty.
             view_job_buttons = []
-            for selector in view_job_selectors:
+            for selector in (VIEW_JOB_CSS_UNION, *VIEW_JOB_XPATH_SELECTORS):
                 try:
                     buttons = await self.page.query_selector_all(selector)
+                    # Fire the visibility/enabled probes for all buttons at
+                    # once; serially they cost two round-trips per button.
+                    states = await asyncio.gather(*(
+                        asyncio.gather(btn.is_visible(), btn.is_enabled()) for btn in buttons
+                    ))
                     visible_buttons = []
-                    for btn in buttons:
-                        if await btn.is_visible() and await btn.is_enabled():
-                             visible_buttons.append(btn)
+                    for btn, (visible, enabled) in zip(buttons, states):
+                        if visible and enabled:
+                            visible_buttons.append(btn)
+                        else:
+                            # Don't retain handles to buttons we can't use
+                            await btn.dispose()
 
                     if visible_buttons: # If this selector yields any visible and enabled buttons
                         view_job_buttons = visible_buttons
                         logger.info(f"Found {len(view_job_buttons)} 'View job' button(s) with selector: {selector}")
                         break # Use the first selector that finds buttons
                 except Exception as e:
-                    logger.debug(f"Selector {selector} for 'View job' button failed or found no elements: {str(e)}")
+                    logger.debug("Selector %s for 'View job' button failed or found no elements: %s", selector, str(e))
 
             if not view_job_buttons:
                 logger.warning("No 'View job' buttons found on the page.")
-                await self.page.screenshot(path="view_job_button_not_found.png")
+                if self.debug:
+                    await self.page.screenshot(path="view_job_button_not_found.png")
                 return False
 
             if job_index >= len(view_job_buttons):
                 logger.warning(f"'View job' button index {job_index} is out of range. Found {len(view_job_buttons)} buttons.")
-                await self.page.screenshot(path="view_job_button_index_error.png")
+                if self.debug:
+                    await self.page.screenshot(path="view_job_button_index_error.png")
                 return False
 
             target_button = view_job_buttons[job_index]
@@ -851,6 +1293,6 @@ Best regards,
 
         except Exception as e:
             logger.error(f"Failed to click 'View job' button at index {job_index}: {str(e)}")
-            if self.page:
+            if self.page and self.debug:
                 await self.page.screenshot(path="view_job_button_error.png")
             return False
\ No newline at end of file
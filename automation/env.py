@@ -0,0 +1,18 @@
+"""One-shot .env loading shared by the entry-point scripts."""
+import os
+from functools import lru_cache
+
+from dotenv import dotenv_values
+
+
+@lru_cache(maxsize=1)
+def load_env_once() -> bool:
+    """Parses .env a single time per process and populates os.environ.
+
+    Drop-in replacement for the load_dotenv() calls scattered across the
+    scripts: repeat calls are free instead of re-reading and re-parsing the
+    file. Values already present in the environment win over .env entries.
+    """
+    for key, value in dotenv_values(".env").items():
+        os.environ.setdefault(key, value or "")
+    return True
@@ -0,0 +1,53 @@
+"""Shared logging setup for the entry-point scripts."""
+import atexit
+import logging
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+from typing import Optional
+
+_listener: Optional[QueueListener] = None
+
+
+def setup_logging(log_file: str, level: int = logging.INFO) -> QueueListener:
+    """Configures root logging through a background QueueListener.
+
+    The console/file handlers run on the listener's thread, so a slow disk
+    write never stalls the event loop (and with it every in-flight Playwright
+    call) — the logging hot path only pays a queue put. The listener is
+    stopped at exit to flush anything still queued.
+
+    Like basicConfig, the first caller wins: repeat calls (e.g. pytest
+    importing several scripts into one process) return the existing listener
+    instead of stacking another QueueHandler and thread that would duplicate
+    every record.
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    queue: SimpleQueue = SimpleQueue()
+    listener = QueueListener(
+        queue,
+        logging.StreamHandler(),
+        # delay=True: don't create the log file until something is logged
+        logging.FileHandler(log_file, delay=True),
+        respect_handler_level=True,
+    )
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    for handler in listener.handlers:
+        handler.setFormatter(formatter)
+
+    # Wire the root logger by hand: basicConfig would put a formatter on the
+    # QueueHandler too, formatting every record twice.
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(QueueHandler(queue))
+
+    listener.start()
+
+    def _stop():
+        if listener._thread is not None:  # tolerate an explicit earlier stop()
+            listener.stop()
+    atexit.register(_stop)
+    _listener = listener
+    return listener
@@ -1,46 +1,39 @@
 import pytest
-import asyncio
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 from playwright.async_api import Page, Browser, BrowserContext, ElementHandle
 
-from automation.core import JobAutomator
+from automation.core import (
+    JobAutomator,
+    SEND_MESSAGE_UNION,
+    VIEW_JOB_CSS_UNION,
+    VIEW_JOB_XPATH_SELECTORS,
+)
 
 @pytest.fixture
-async def automator():
-    """Fixture to create a JobAutomator instance with mocked Playwright objects."""
-    with patch('playwright.async_api.async_playwright') as mock_playwright_context:
-        mock_playwright_instance = AsyncMock()
-        mock_playwright_context.start.return_value = mock_playwright_instance
+def automator():
+    """Fixture to create a JobAutomator instance with mocked Playwright objects.
 
-        mock_browser = AsyncMock(spec=Browser)
-        mock_playwright_instance.chromium.launch.return_value = mock_browser
+    Builds plain mocks and injects them directly — nothing under test starts
+    async_playwright, so there is no patch context or async teardown to pay
+    for on every test.
+    """
+    mock_page = AsyncMock(spec=Page)
 
-        mock_context = AsyncMock(spec=BrowserContext)
-        mock_browser.new_context.return_value = mock_context
+    # Mock page methods that might be called during setup or in the methods
+    mock_page.on = MagicMock()
+    mock_page.wait_for_selector = AsyncMock()
+    mock_page.query_selector_all = AsyncMock(return_value=[])
+    mock_page.screenshot = AsyncMock()
+    mock_page.click = AsyncMock()
+    mock_page.wait_for_load_state = AsyncMock()
 
-        mock_page = AsyncMock(spec=Page)
-        mock_context.new_page.return_value = mock_page
+    automator_instance = JobAutomator(headless=True)
+    automator_instance.browser = AsyncMock(spec=Browser)
+    automator_instance.context = AsyncMock(spec=BrowserContext)
+    automator_instance.page = mock_page
 
-        # Mock page methods that might be called during setup or in the methods
-        mock_page.on = MagicMock()
-        mock_page.wait_for_selector = AsyncMock()
-        mock_page.query_selector_all = AsyncMock(return_value=[])
-        mock_page.screenshot = AsyncMock()
-        mock_page.click = AsyncMock()
-        mock_page.wait_for_load_state = AsyncMock()
-
-        automator_instance = JobAutomator(headless=True)
-        automator_instance.playwright = mock_playwright_instance
-        automator_instance.browser = mock_browser
-        automator_instance.context = mock_context
-        automator_instance.page = mock_page
-
-        yield automator_instance
-
-        # Ensure cleanup if necessary, though mocks usually handle this
-        if hasattr(automator_instance, 'close') and asyncio.iscoroutinefunction(automator_instance.close):
-             await automator_instance.close()
+    return automator_instance
 
 
 @pytest.mark.asyncio
@@ -49,18 +42,18 @@ async def test_click_send_message_button_success(automator: JobAutomator):
     mock_button = AsyncMock(spec=ElementHandle)
     mock_button.is_enabled.return_value = True
 
-    # Configure wait_for_selector to return our mock button for one of the selectors
+    # Configure wait_for_selector to return our mock button for the union probe
     async def side_effect_wait_for_selector(selector, state, timeout):
-        if selector == 'button:has-text("Send Message")':
+        if selector == SEND_MESSAGE_UNION:
             return mock_button
-        raise TimeoutError("Selector not found") # Simulate timeout for other selectors
+        raise TimeoutError("Selector not found") # Simulate timeout for anything else
 
     automator.page.wait_for_selector = AsyncMock(side_effect=side_effect_wait_for_selector)
 
     result = await automator.click_send_message_button()
 
     assert result is True
-    automator.page.wait_for_selector.assert_any_call('button:has-text("Send Message")', state="visible", timeout=5000)
+    automator.page.wait_for_selector.assert_called_once_with(SEND_MESSAGE_UNION, state="visible", timeout=5000)
     mock_button.is_enabled.assert_called_once()
     mock_button.click.assert_called_once()
     automator.page.screenshot.assert_not_called() # No error screenshots
@@ -68,6 +61,7 @@ async def test_click_send_message_button_success(automator: JobAutomator):
 @pytest.mark.asyncio
 async def test_click_send_message_button_not_found(automator: JobAutomator):
     """Test 'Send message' button not found."""
+    automator.debug = True  # failure screenshots are debug-gated
     automator.page.wait_for_selector = AsyncMock(side_effect=TimeoutError("Button not found"))
 
     result = await automator.click_send_message_button()
@@ -80,8 +74,9 @@ async def test_click_send_message_button_disabled(automator: JobAutomator):
     """Test 'Send message' button found but disabled."""
     mock_button = AsyncMock(spec=ElementHandle)
     mock_button.is_enabled.return_value = False # Simulate disabled button
+    automator.debug = True  # failure screenshots are debug-gated
 
-    # Return this disabled button for the first valid selector
+    # Return this disabled button for the union probe
     automator.page.wait_for_selector = AsyncMock(return_value=mock_button)
 
     result = await automator.click_send_message_button()
@@ -89,7 +84,7 @@ async def test_click_send_message_button_disabled(automator: JobAutomator):
     assert result is False
     mock_button.is_enabled.assert_called() # is_enabled is checked
     mock_button.click.assert_not_called() # Click should not happen
-    automator.page.screenshot.assert_called_once_with(path="send_message_button_not_found.png") # Because it will iterate and not find an enabled one
+    automator.page.screenshot.assert_called_once_with(path="send_message_button_not_found.png") # No enabled button found
 
 @pytest.mark.asyncio
 async def test_click_send_message_button_runtime_error(automator: JobAutomator):
@@ -113,7 +108,7 @@ async def test_click_view_job_button_success(automator: JobAutomator):
     result = await automator.click_view_job_button(job_index=0)
 
     assert result is True
-    automator.page.query_selector_all.assert_any_call('a:has-text("View Job")') # Example selector
+    automator.page.query_selector_all.assert_any_call(VIEW_JOB_CSS_UNION)
     mock_button_1.scroll_into_view_if_needed.assert_called_once()
     mock_button_1.click.assert_called_once()
     automator.page.wait_for_load_state.assert_called_once_with("domcontentloaded", timeout=10000)
@@ -122,6 +117,7 @@ async def test_click_view_job_button_success(automator: JobAutomator):
 @pytest.mark.asyncio
 async def test_click_view_job_button_not_found(automator: JobAutomator):
     """Test 'View job' button not found."""
+    automator.debug = True  # failure screenshots are debug-gated
     automator.page.query_selector_all = AsyncMock(return_value=[]) # No buttons found
 
     result = await automator.click_view_job_button()
@@ -132,6 +128,7 @@ async def test_click_view_job_button_not_found(automator: JobAutomator):
 @pytest.mark.asyncio
 async def test_click_view_job_button_index_out_of_range(automator: JobAutomator):
     """Test 'View job' button index out of range."""
+    automator.debug = True  # failure screenshots are debug-gated
     mock_button_1 = AsyncMock(spec=ElementHandle)
     mock_button_1.is_visible.return_value = True
     mock_button_1.is_enabled.return_value = True
@@ -146,6 +143,7 @@ async def test_click_view_job_button_index_out_of_range(automator: JobAutomator)
 @pytest.mark.asyncio
 async def test_click_view_job_button_not_visible_or_disabled(automator: JobAutomator):
     """Test 'View job' buttons are found but none are suitable (e.g. not visible/disabled)."""
+    automator.debug = True  # failure screenshots are debug-gated
     mock_button_invisible = AsyncMock(spec=ElementHandle)
     mock_button_invisible.is_visible.return_value = False # Not visible
     mock_button_invisible.is_enabled.return_value = True
@@ -165,7 +163,7 @@ async def test_click_view_job_button_not_visible_or_disabled(automator: JobAutom
 
 @pytest.mark.asyncio
 async def test_click_view_job_button_uses_correct_selector_order(automator: JobAutomator):
-    """Test that click_view_job_button tries selectors in order and uses the first one that works."""
+    """Test that click_view_job_button probes the CSS union first, then the XPath fallbacks."""
     mock_button_good = AsyncMock(spec=ElementHandle)
     mock_button_good.is_visible.return_value = True
     mock_button_good.is_enabled.return_value = True
@@ -174,9 +172,9 @@ async def test_click_view_job_button_uses_correct_selector_order(automator: JobA
 
     # Mock query_selector_all to behave differently based on selector
     async def qsa_side_effect(selector_str):
-        if selector_str == 'a:has-text("View Job")': # First selector, returns nothing
+        if selector_str == VIEW_JOB_CSS_UNION: # Union returns nothing
             return []
-        elif selector_str == 'button:has-text("View Job")': # Second selector, returns the good button
+        elif selector_str == VIEW_JOB_XPATH_SELECTORS[0]: # First XPath fallback hits
             return [mock_button_good]
         return [] # Default for other selectors
 
@@ -185,15 +183,16 @@ async def test_click_view_job_button_uses_correct_selector_order(automator: JobA
     result = await automator.click_view_job_button(job_index=0)
 
     assert result is True
-    # Check that it was called with both selectors (or at least up to the one that worked)
-    automator.page.query_selector_all.assert_any_call('a:has-text("View Job")')
-    automator.page.query_selector_all.assert_any_call('button:has-text("View Job")')
+    # Check that the union was probed before the XPath fallback
+    automator.page.query_selector_all.assert_any_call(VIEW_JOB_CSS_UNION)
+    automator.page.query_selector_all.assert_any_call(VIEW_JOB_XPATH_SELECTORS[0])
     mock_button_good.click.assert_called_once()
     automator.page.wait_for_load_state.assert_called_once()
 
 @pytest.mark.asyncio
 async def test_click_view_job_button_exception_during_click(automator: JobAutomator):
     """Test handling of an exception during the button click itself."""
+    automator.debug = True  # failure screenshots are debug-gated
     mock_button = AsyncMock(spec=ElementHandle)
     mock_button.is_visible.return_value = True
     mock_button.is_enabled.return_value = True
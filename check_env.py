@@ -1,7 +1,12 @@
 #!/usr/bin/env python3
 """Simple script to check Python environment and imports."""
+import importlib.util
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
+
+# Distribution names whose import name differs
+IMPORT_NAMES = {'python-dotenv': 'dotenv'}
 
 def main():
     print("=" * 80)
@@ -18,14 +23,18 @@ def main():
         if 'PATH' in key or 'PYTHON' in key or 'VIRTUAL' in key:
             print(f"  {key} = {os.environ[key]}")
     
-    print("\nTrying to import packages:")
+    print("\nChecking package availability:")
     packages = ['playwright', 'pydantic', 'fastapi', 'uvicorn', 'python-dotenv', 'loguru']
-    for pkg in packages:
-        try:
-            __import__(pkg)
-            print(f"  ✅ {pkg}")
-        except ImportError as e:
-            print(f"  ❌ {pkg}: {e}")
+    # find_spec only resolves the module — no import side effects, so the
+    # check doesn't pay e.g. playwright's slow initialization. It also
+    # handles dist names that differ from import names (python-dotenv).
+    # The probes are filesystem stats, so running them in threads turns
+    # sum-of-latencies into max-of-latencies on cold caches.
+    with ThreadPoolExecutor(max_workers=len(packages)) as executor:
+        specs = executor.map(importlib.util.find_spec,
+                             (IMPORT_NAMES.get(pkg, pkg) for pkg in packages))
+    for pkg, spec in zip(packages, specs):
+        print(f"  ✅ {pkg}" if spec else f"  ❌ {pkg}: not found")
 
 if __name__ == "__main__":
     main()
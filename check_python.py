@@ -2,25 +2,7 @@
 """Check Python environment and package installation."""
 import sys
 import os
-import subprocess
-
-def run_command(cmd):
-    print(f"\n$ {cmd}")
-    try:
-        result = subprocess.run(
-            cmd,
-            shell=True,
-            check=True,
-            text=True,
-            capture_output=True
-        )
-        print(result.stdout)
-        return result.returncode == 0
-    except subprocess.CalledProcessError as e:
-        print(f"Error: {e}")
-        print(f"STDOUT: {e.stdout}")
-        print(f"STDERR: {e.stderr}")
-        return False
+from importlib.metadata import distributions, version, PackageNotFoundError
 
 def main():
     print("=" * 80)
@@ -40,13 +22,18 @@ def main():
             print(f"  source {venv_path}/bin/activate")
         return
     
-    # Check pip list
+    # Enumerate distributions in-process; shelling out to pip pays a
+    # fork/exec plus pip's own multi-hundred-ms startup
     print("\nInstalled packages:")
-    run_command(f"{sys.executable} -m pip list")
-    
+    for dist in sorted(distributions(), key=lambda d: d.metadata['Name'].lower()):
+        print(f"  {dist.metadata['Name']}=={dist.version}")
+
     # Check playwright installation
     print("\nChecking Playwright installation:")
-    run_command(f"{sys.executable} -m pip show playwright")
+    try:
+        print(f"  playwright {version('playwright')}")
+    except PackageNotFoundError:
+        print("  ❌ playwright is not installed")
     
     # Try to import playwright
     print("\nTrying to import playwright:")
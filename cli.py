@@ -2,61 +2,45 @@
 """
 Command-line interface for the Job Automator
 """
-import os
 import sys
 import asyncio
 import logging
 from pathlib import Path
-from dotenv import load_dotenv
+from automation.config import Config
 
 # Add project root to path
 sys.path.append(str(Path(__file__).parent))
 
-from automation.core import JobAutomator
+from automation.logging_setup import setup_logging
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('automation.log')
-    ]
-)
+# Queue-backed handlers keep disk writes off the event loop
+setup_logging('automation.log')
 
 logger = logging.getLogger(__name__)
 
 async def main():
     """Main entry point for the CLI"""
-    # Load environment variables
-    load_dotenv()
-    
-    # Get credentials
-    email = os.getenv("WORK_AT_A_STARTUP_EMAIL")
-    password = os.getenv("WORK_AT_A_STARTUP_PASSWORD")
-    
-    if not email or not password:
+    # Snapshot env-derived settings once
+    config = Config.load()
+
+    if not config.email or not config.password:
         logger.error("Missing required environment variables. Please set WORK_AT_A_STARTUP_EMAIL and WORK_AT_A_STARTUP_PASSWORD in .env")
         sys.exit(1)
-    
-    # Get max applications (default: 5)
-    try:
-        max_applications = int(os.getenv("MAX_APPLICATIONS", "5"))
-    except ValueError:
-        max_applications = 5
-    
-    # Headless mode (default: False for local dev)
-    headless = os.getenv("HEADLESS", "false").lower() == "true"
-    
-    logger.info(f"Starting job automation (max applications: {max_applications}, headless: {headless})")
-    
+
+    logger.info(f"Starting job automation (max applications: {config.max_applications}, headless: {config.headless})")
+
+    # Deferred import: pulling in automation.core drags the whole Playwright
+    # async API along, which the missing-credentials exit above never needs
+    from automation.core import JobAutomator
+
     try:
         # Run the automation
-        async with JobAutomator(headless=headless) as automator:
+        async with JobAutomator(headless=config.headless) as automator:
             results = await automator.run(
-                email=email,
-                password=password,
-                max_applications=max_applications
+                email=config.email,
+                password=config.password,
+                max_applications=config.max_applications
             )
             
             # Print results
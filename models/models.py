@@ -1,8 +1,14 @@
+import re
 from enum import Enum
-from datetime import datetime
-from pydantic import BaseModel, HttpUrl
+from datetime import datetime, timezone
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl
 from typing import Optional, List, Dict, Any
 
+# Seniority phrasings that mark an entry-level posting, compiled once so the
+# per-listing property is one case-insensitive scan rather than five substring
+# passes over a lowercased copy.
+_JUNIOR_RE = re.compile(r"entry|junior|0-1|0-2|1\+", re.IGNORECASE)
+
 class ApplicationStatus(str, Enum):
     DRAFT = "draft"
     SUBMITTED = "submitted"
@@ -12,6 +18,11 @@ class ApplicationStatus(str, Enum):
 
 class JobListing(BaseModel):
     """Represents a job listing from workatastartup.com"""
+    # Read-only once scraped; frozen instances skip per-field mutation
+    # machinery and extra="ignore" drops unknown keys from scraped dicts
+    # instead of carrying them around.
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     id: str
     title: str
     company: str
@@ -21,15 +32,22 @@ class JobListing(BaseModel):
     posted_at: Optional[datetime] = None
     skills: List[str] = []
     experience_level: Optional[str] = None
-    created_at: datetime = datetime.utcnow()
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     
     @property
     def is_junior(self) -> bool:
         """Check if this is a junior/entry-level position"""
-        if not self.experience_level:
-            return False
-        return any(term in self.experience_level.lower() 
-                  for term in ["entry", "junior", "0-1", "0-2", "1+"])
+        return bool(self.experience_level and _JUNIOR_RE.search(self.experience_level))
+
+    @classmethod
+    def bulk_from_dicts(cls, rows: List[Dict[str, Any]]) -> List["JobListing"]:
+        """Builds listings from dicts produced by our own extractor.
+
+        model_construct skips per-field validator dispatch, which dominates
+        when ingesting hundreds of already-shaped rows; keep full validation
+        (the normal constructor) for anything from outside the scraper.
+        """
+        return [cls.model_construct(**row) for row in rows]
 
 class Application(BaseModel):
     """Represents a job application"""
@@ -38,7 +56,7 @@ class Application(BaseModel):
     status: ApplicationStatus = ApplicationStatus.DRAFT
     cover_letter: str
     applied_at: Optional[datetime] = None
-    updated_at: datetime = datetime.utcnow()
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     notes: Optional[str] = None
     
     # Metadata for cloud sync
@@ -47,6 +65,8 @@ class Application(BaseModel):
 
 class JobFilter(BaseModel):
     """Filter criteria for job search"""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     experience_level: str = "0-1"  # Default to entry-level
     roles: List[str] = ["Software Engineer", "Developer", "Engineer"]
     remote_only: bool = True
@@ -13,6 +13,9 @@ setup(
         "httpx>=0.27.0",
         "python-multipart>=0.0.9",
         "loguru>=0.7.2",
+        "aiofiles>=23.2.1",
+        "orjson>=3.8",
+        'uvloop>=0.19; platform_system != "Windows"',
     ],
     entry_points={
         "console_scripts": [
@@ -5,153 +5,165 @@ Test script to browse jobs on workatastartup.com and generate cover letters.
 import asyncio
 import os
 import sys
-import json
+import orjson
 from pathlib import Path
 from typing import List, Dict, Any
-from dotenv import load_dotenv
 
 # Add project root to path
 project_root = str(Path(__file__).parent)
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-from automation.core import JobAutomator, JobFilter
+from automation import IO_POOL
+from automation.env import load_env_once
+from automation.logging_setup import setup_logging
 
 # Configure logging
 import logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('browse_jobs.log')
-    ]
-)
+# Queue-backed handlers keep disk writes off the event loop
+setup_logging('browse_jobs.log')
 
 logger = logging.getLogger(__name__)
 
+async def ainput(prompt: str) -> str:
+    """input() without blocking the event loop.
+
+    The prompt can sit for however long the user thinks; running it on a
+    worker thread keeps Playwright's CDP pump (and any background tasks)
+    alive in the meantime.
+    """
+    return await asyncio.get_running_loop().run_in_executor(IO_POOL, input, prompt)
+
 async def browse_jobs(max_jobs: int = 10) -> List[Dict[str, Any]]:
     """Browse jobs on workatastartup.com and return job listings"""
+    # Deferred import: pulling in automation.core drags the whole Playwright
+    # async API along, which importing this module for its helpers never needs
+    from automation.core import JobAutomator, JobFilter
+
     logger.info("Starting job browser...")
-    
-    # Initialize the automator with headless=False to see the browser
-    # and slow_mo to slow down the automation for better visibility
-    automator = JobAutomator(headless=False, slow_mo=100)  # 100ms delay between actions
-    
+
+    # Initialize the automator with headless=False to see the browser.
+    # Set SLOW_MO (ms) to slow actions down for visibility; default runs at
+    # full speed so CI isn't throttled. generate_cover_letters opts back in
+    # to letter generation during the test-mode dry run — displaying the
+    # letter is what this script is for.
+    automator = JobAutomator(headless=False, slow_mo=int(os.getenv("SLOW_MO", "0")),
+                             generate_cover_letters=True)
+
+    # Background tasks processing the first few jobs, keyed by job index
+    prefetch: Dict[int, asyncio.Task] = {}
+
     try:
         # Set up the browser and page
         logger.info("Initializing browser...")
         await automator.setup()
-        
-        # Create a new page
-        logger.info("Creating new page...")
-        automator.page = await automator.context.new_page()
-        
+
         # Load environment variables
-        load_dotenv()
-        
+        load_env_once()
+
         # Get credentials
         email = os.getenv("WORK_AT_A_STARTUP_EMAIL")
         password = os.getenv("WORK_AT_A_STARTUP_PASSWORD")
-        
+
         if not email or not password:
             logger.error("Missing required environment variables. Please set WORK_AT_A_STARTUP_EMAIL and WORK_AT_A_STARTUP_PASSWORD in .env")
             return []
-        
+
         # Login
         logger.info("Logging in...")
         login_success = await automator.login(email, password)
         if not login_success:
             logger.error("Login failed")
             return []
-        
+
         logger.info("Login successful!")
-        
-        # Add a small delay to see the result
-        await asyncio.sleep(2)
-        
-        # Rest of your browsing logic will go here
-        logger.info("Browsing jobs...")
-        
-        # Return empty list for now - we'll implement job listing retrieval next
-        return []
-        
+
+        # Apply filters
+        logger.info("Applying filters...")
+        job_filter = JobFilter()
+        await automator.apply_filters(job_filter)
+
+        # Get job listings
+        logger.info(f"Fetching up to {max_jobs} job listings...")
+        jobs = await automator.get_job_listings(max_listings=max_jobs)
+
+        logger.info(f"\nFound {len(jobs)} jobs:")
+        for i, job in enumerate(jobs, 1):
+            print(f"{i}. {job.get('title', 'No title')} at {job.get('company', 'Unknown company')}")
+            print(f"   {job.get('url')}")
+            print()
+
+        # Start processing the first few jobs in the background on their own
+        # pages, so by the time the user has read the list and typed a number
+        # the result is usually already sitting in a finished task.
+        async def _prefetch(job: Dict[str, Any]) -> Dict[str, Any]:
+            page = await automator.context.new_page()
+            try:
+                return await automator.process_job_application(job, page=page)
+            finally:
+                await page.close()
+
+        for idx in range(min(len(jobs), 4)):
+            prefetch[idx] = asyncio.create_task(_prefetch(jobs[idx]))
+
+        # Let user select a job
+        while True:
+            try:
+                selection = await ainput(f"\nEnter a job number (1-{len(jobs)}) to generate a cover letter, or 'q' to quit: ")
+                if selection.lower() == 'q':
+                    return []
+
+                job_index = int(selection) - 1
+                if 0 <= job_index < len(jobs):
+                    selected_job = jobs[job_index]
+                    logger.info(f"\nSelected job: {selected_job.get('title')}")
+
+                    # Use the prefetched result when there is one (awaiting a
+                    # finished task returns immediately), otherwise process on
+                    # demand.
+                    task = prefetch.get(job_index)
+                    if task is not None:
+                        result = await task
+                    else:
+                        result = await automator.process_job_application(selected_job)
+
+                    # Save the results; the disk write happens on the shared
+                    # pool so the event loop never blocks on it
+                    await asyncio.get_running_loop().run_in_executor(
+                        IO_POOL,
+                        Path('job_application_result.json').write_bytes,
+                        orjson.dumps(result, option=orjson.OPT_INDENT_2),
+                    )
+
+                    # Display the cover letter (error results carry none)
+                    if result.get('cover_letter'):
+                        print("\n" + "="*80)
+                        print("GENERATED COVER LETTER:")
+                        print("-"*80)
+                        print(result['cover_letter'])
+                        print("="*80 + "\n")
+
+                    # Ask if user wants to continue with another job
+                    cont = await ainput("Would you like to try another job? (y/n): ")
+                    if cont.lower() != 'y':
+                        break
+                else:
+                    print(f"Please enter a number between 1 and {len(jobs)}")
+            except ValueError:
+                print("Please enter a valid number or 'q' to quit")
+
+        return jobs
+
     except Exception as e:
-        logger.error(f"Error during browsing: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.error(f"Error browsing jobs: {str(e)}", exc_info=True)
         return []
     finally:
+        # Drop any prefetch still in flight before tearing the browser down
+        for task in prefetch.values():
+            task.cancel()
         # Make sure to close the browser when done
         logger.info("Closing browser...")
         await automator.close()
-    
-    # Run in non-headless mode so we can see what's happening
-    async with JobAutomator(headless=False, slow_mo=100) as automator:
-        try:
-            # Login
-            logger.info("Logging in...")
-            login_success = await automator.login(email, password)
-            if not login_success:
-                logger.error("Login failed")
-                return []
-            
-            # Apply filters
-            logger.info("Applying filters...")
-            job_filter = JobFilter()
-            await automator.apply_filters(job_filter)
-            
-            # Get job listings
-            logger.info(f"Fetching up to {max_jobs} job listings...")
-            jobs = await automator.get_job_listings(max_listings=max_jobs)
-            
-            logger.info(f"\nFound {len(jobs)} jobs:")
-            for i, job in enumerate(jobs, 1):
-                print(f"{i}. {job.get('title', 'No title')} at {job.get('company', 'Unknown company')}")
-                print(f"   {job.get('url')}")
-                print()
-            
-            # Let user select a job
-            while True:
-                try:
-                    selection = input(f"\nEnter a job number (1-{len(jobs)}) to generate a cover letter, or 'q' to quit: ")
-                    if selection.lower() == 'q':
-                        return []
-                    
-                    job_index = int(selection) - 1
-                    if 0 <= job_index < len(jobs):
-                        selected_job = jobs[job_index]
-                        logger.info(f"\nSelected job: {selected_job.get('title')}")
-                        
-                        # Process the job application
-                        result = await automator.process_job_application(selected_job)
-                        
-                        # Save the results
-                        with open('job_application_result.json', 'w') as f:
-                            json.dump(result, f, indent=2)
-                        
-                        # Display the cover letter
-                        if 'cover_letter' in result:
-                            print("\n" + "="*80)
-                            print("GENERATED COVER LETTER:")
-                            print("-"*80)
-                            print(result['cover_letter'])
-                            print("="*80 + "\n")
-                        
-                        # Ask if user wants to continue with another job
-                        cont = input("Would you like to try another job? (y/n): ")
-                        if cont.lower() != 'y':
-                            break
-                    else:
-                        print(f"Please enter a number between 1 and {len(jobs)}")
-                except ValueError:
-                    print("Please enter a valid number or 'q' to quit")
-            
-            return jobs
-            
-        except Exception as e:
-            logger.error(f"Error browsing jobs: {str(e)}", exc_info=True)
-            return []
 
 if __name__ == "__main__":
     # Run the job browser
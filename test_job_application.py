@@ -6,32 +6,27 @@ This will extract job details and generate a cover letter without submitting.
 import asyncio
 import os
 import sys
-import json
+import orjson
 from pathlib import Path
-from dotenv import load_dotenv
 
 # Add project root to path
 sys.path.append(str(Path(__file__).parent))
 
-from automation.core import JobAutomator
+from automation import IO_POOL
+from automation.env import load_env_once
+from automation.logging_setup import setup_logging
 
 # Configure logging
 import logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('test_application.log')
-    ]
-)
+# Queue-backed handlers keep disk writes off the event loop
+setup_logging('test_application.log')
 
 logger = logging.getLogger(__name__)
 
 async def test_job_application(job_url: str):
     """Test the job application process for a single job"""
     # Load environment variables
-    load_dotenv()
+    load_env_once()
     
     # Get credentials
     email = os.getenv("WORK_AT_A_STARTUP_EMAIL")
@@ -40,7 +35,11 @@ async def test_job_application(job_url: str):
     if not email or not password:
         logger.error("Missing required environment variables. Please set WORK_AT_A_STARTUP_EMAIL and WORK_AT_A_STARTUP_PASSWORD in .env")
         sys.exit(1)
-    
+
+    # Deferred import: pulling in automation.core drags the whole Playwright
+    # async API along, which the missing-credentials exit above never needs
+    from automation.core import JobAutomator
+
     # Create a test job object
     job = {
         "id": "test_job_123",
@@ -53,8 +52,12 @@ async def test_job_application(job_url: str):
     
     logger.info(f"Starting test job application for: {job_url}")
     
-    # Run in non-headless mode so we can see what's happening
-    async with JobAutomator(headless=False, slow_mo=100) as automator:
+    # Run in non-headless mode so we can see what's happening; set SLOW_MO
+    # (ms) to slow actions down for visibility
+    # generate_cover_letters: this script's whole point is inspecting the
+    # letter, so opt back in to generation during the test-mode dry run
+    async with JobAutomator(headless=False, slow_mo=int(os.getenv("SLOW_MO", "0")),
+                            generate_cover_letters=True) as automator:
         try:
             # Login
             login_success = await automator.login(email, password)
@@ -65,9 +68,13 @@ async def test_job_application(job_url: str):
             # Process the job application (in test mode)
             result = await automator.process_job_application(job)
             
-            # Save the results
-            with open('test_application_result.json', 'w') as f:
-                json.dump(result, f, indent=2)
+            # Save the results; the disk write happens on the shared pool so
+            # the event loop never blocks on it
+            await asyncio.get_running_loop().run_in_executor(
+                IO_POOL,
+                Path('test_application_result.json').write_bytes,
+                orjson.dumps(result, option=orjson.OPT_INDENT_2),
+            )
             
             logger.info("\n" + "="*80)
             logger.info("TEST COMPLETED SUCCESSFULLY")
@@ -78,8 +85,10 @@ async def test_job_application(job_url: str):
             
             # Keep the browser open for inspection
             if os.getenv('KEEP_BROWSER_OPEN', 'false').lower() == 'true':
-                logger.info("Keeping browser open for inspection (set KEEP_BROWSER_OPEN=false to disable)")
-                await asyncio.sleep(3600)  # Keep open for 1 hour
+                logger.info("Keeping browser open for inspection; close the page to exit")
+                # Returns the moment the inspector closes the page instead of
+                # pinning the process for a flat hour
+                await automator.page.wait_for_event("close", timeout=0)
             
         except Exception as e:
             logger.error(f"Test failed: {str(e)}", exc_info=True)
@@ -3,25 +3,25 @@
 import sys
 import os
 import subprocess
+from importlib.metadata import distributions, version, PackageNotFoundError
 
 def run_command(cmd):
     print(f"\n$ {cmd}")
-    try:
-        result = subprocess.run(
-            cmd,
-            shell=True,
-            check=True,
-            text=True,
-            capture_output=True,
-            executable='/bin/zsh'  # Explicitly use zsh shell
-        )
-        print(result.stdout)
-        return True, result.stdout
-    except subprocess.CalledProcessError as e:
-        print(f"Error: {e}")
-        print(f"STDOUT: {e.stdout}")
-        print(f"STDERR: {e.stderr}")
-        return False, e.stderr
+    # Stream output line by line: constant memory instead of buffering the
+    # whole thing, and output appears as the command produces it. The default
+    # /bin/sh is plenty for these commands and spawns faster than zsh.
+    with subprocess.Popen(
+        cmd,
+        shell=True,
+        text=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT
+    ) as proc:
+        for line in proc.stdout:
+            sys.stdout.write(line)
+    if proc.returncode != 0:
+        print(f"Error: command exited with {proc.returncode}")
+    return proc.returncode == 0
 
 def main():
     print("=" * 80)
@@ -42,13 +42,18 @@ def main():
             print(f"  source {venv_path}/bin/activate")
         return
     
-    # Check pip list
+    # Enumerate distributions in-process; shelling out to pip pays a
+    # fork/exec plus pip's own multi-hundred-ms startup
     print("\nInstalled packages:")
-    success, _ = run_command(f"{sys.executable} -m pip list")
-    
+    for dist in sorted(distributions(), key=lambda d: d.metadata['Name'].lower()):
+        print(f"  {dist.metadata['Name']}=={dist.version}")
+
     # Check playwright installation
     print("\nChecking Playwright installation:")
-    success, _ = run_command(f"{sys.executable} -m pip show playwright")
+    try:
+        print(f"  playwright {version('playwright')}")
+    except PackageNotFoundError:
+        print("  ❌ playwright is not installed")
     
     # Try to import playwright
     print("\nTrying to import playwright:")